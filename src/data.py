@@ -5,11 +5,16 @@ Uses SQLite database with destination information.
 
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import numpy as np
+import streamlit as st
 
 # Path to database file
 DB_PATH = Path(__file__).parent.parent / "data" / "travel.db"
 
+# How long query results are reused across reruns and sessions (in seconds)
+CACHE_TTL = 60 * 60
+
 
 # Database connection
 def get_connection():
@@ -18,39 +23,64 @@ def get_connection():
     return sqlite3.connect(DB_PATH)
 
 
-# Load all destinations from database
+# Build dicts from plain row tuples, looking up the column names only once per query
+def _rows_to_dicts(cur: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    columns = [c[0] for c in cur.description]
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+# Load all destinations from database (cached, callers get their own copy)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_all_destinations() -> List[Dict[str, Any]]:
     conn = get_connection()
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM destinations;")
-    rows = cur.fetchall()
+    destinations = _rows_to_dicts(conn.execute("SELECT * FROM destinations;"))
+    conn.close()
+    return destinations
+
+
+# Load only the cost columns as NumPy arrays (cached like the full rows, so both expire together)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _get_cost_columns() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    conn = get_connection()
+    rows = conn.execute("SELECT id, flight_price, avg_budget_per_day FROM destinations ORDER BY id;").fetchall()
+    conn.close()
+    
+    ids = np.array([r[0] for r in rows], dtype=np.int64)
+    flights = np.array([r[1] or 0 for r in rows], dtype=np.float64)
+    daily = np.array([r[2] or 0 for r in rows], dtype=np.float64)
+    return ids, flights, daily
+
+
+# Load full rows for the given destination ids
+def _get_destinations_by_ids(ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    conn = get_connection()
+    placeholders = ",".join("?" * len(ids))
+    rows = _rows_to_dicts(conn.execute(f"SELECT * FROM destinations WHERE id IN ({placeholders});", ids))
     conn.close()
-    return [dict(r) for r in rows]
+    return {r["id"]: r for r in rows}
 
 
-# Filter destinations by budget and calculate total trip cost
+# Filter destinations by budget and calculate total trip cost (cached per budget, days and travelers)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_destinations_by_budget(total_budget: float, trip_days: int, num_travelers: int = 1) -> List[Dict]:
-    all_dests = get_all_destinations()
-    matches = []
+    ids, flights, daily = _get_cost_columns()
+    
+    # Total trip cost for all travelers, calculated for all destinations at once
+    totals = (flights + daily * trip_days) * num_travelers
     
-    # Calculate total trip cost for each destination
-    for dest in all_dests:
-        flight = dest.get('flight_price') or 0
-        daily = dest.get('avg_budget_per_day') or 0
-        
-        # Total for all travelers
-        flight_total = flight * num_travelers
-        daily_total = daily * trip_days * num_travelers
-        total = flight_total + daily_total
-        
-        # Allow 20% over budget for flexibility
-        if total <= total_budget * 1.2:
-            d = dest.copy()
-            d['total_trip_cost'] = total
-            d['budget_remaining'] = total_budget - total
-            matches.append(d)
+    # Allow 20% over budget for flexibility, sort cheapest first
+    within = np.flatnonzero(totals <= total_budget * 1.2)
+    within = within[np.argsort(totals[within], kind="stable")]
+    if len(within) == 0:
+        return []
+    
+    # Only build dicts for destinations within budget
+    rows = _get_destinations_by_ids(ids[within].tolist())
+    matches = []
+    for dest_id, total in zip(ids[within].tolist(), totals[within].tolist()):
+        d = rows[dest_id]
+        d['total_trip_cost'] = total
+        d['budget_remaining'] = total_budget - total
+        matches.append(d)
     
-    # Sort cheapest first
-    matches.sort(key=lambda x: x['total_trip_cost'])
     return matches
\ No newline at end of file
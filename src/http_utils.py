@@ -0,0 +1,44 @@
+"""
+Shared HTTP helpers for the external APIs (Open-Meteo weather and Unsplash images).
+Structure as following:
+    - make_session: Pooled requests session that retries server errors.
+    - FailureCache: Short-lived memory of failed requests.
+"""
+
+import time
+from typing import Dict, Hashable
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared session so all requests reuse open connections (keep-alive) instead of a new TCP+TLS handshake per call
+# Only server errors are retried, a 429 rate limit does not clear within a quick retry
+def make_session(pool_maxsize: int, pool_connections: int = 4) -> requests.Session:
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], allowed_methods=["GET"])
+    session.mount("https://", HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry))
+    return session
+
+
+# Time of the last failed request per key, so an unreachable API is not hit again on every rerun (shared by all sessions)
+class FailureCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._failed: Dict[Hashable, float] = {}
+
+    # Check if a request for this key failed recently
+    def recently_failed(self, key: Hashable) -> bool:
+        return time.time() - self._failed.get(key, 0.0) < self.ttl
+
+    # Remember a failed request, dropping expired entries so the dict does not grow with every key
+    def record_failure(self, key: Hashable) -> None:
+        now = time.time()
+        for old_key, failed_at in list(self._failed.items()):
+            if now - failed_at >= self.ttl:
+                self._failed.pop(old_key, None)
+        self._failed[key] = now
+
+    # Forget a key after a successful request
+    def clear(self, key: Hashable) -> None:
+        self._failed.pop(key, None)
\ No newline at end of file
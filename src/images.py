@@ -3,11 +3,13 @@ Image handling using Unsplash API.
 """
 
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import streamlit as st
+from src.http_utils import FailureCache, make_session
 
 # Try Streamlit secrets first, then .env (for accessing the Unsplash API)
 try:
-    import streamlit as st
     UNSPLASH_ACCESS_KEY = st.secrets.get("UNSPLASH_ACCESS_KEY", None)
 except Exception:
     UNSPLASH_ACCESS_KEY = None
@@ -23,6 +25,35 @@ UNSPLASH_API_URL = "https://api.unsplash.com/search/photos"
 # Fallback image if API fails
 FALLBACK_IMAGE = "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=800&h=400&fit=crop"
 
+# How long image search results are reused across reruns and sessions (in seconds)
+IMAGE_CACHE_TTL = 24 * 60 * 60
+MAX_WORKERS = 8  # Parallel image lookups when prefetching
+FAILED_CACHE_TTL = 5 * 60  # Failed lookups are not repeated for a few minutes
+
+# Shared session with pooled connections for all lookups, sending the API key header without rebuilding it
+_SESSION = make_session(MAX_WORKERS, pool_connections=2)
+if UNSPLASH_ACCESS_KEY:
+    _SESSION.headers["Authorization"] = f"Client-ID {UNSPLASH_ACCESS_KEY}"
+
+# Failed lookups per query, so cards rendered after a prefetch do not repeat a request that just failed
+_failed_queries = FailureCache(FAILED_CACHE_TTL)
+
+
+# Search Unsplash and return the raw image URL (None if nothing found), failed requests raise and are therefore never cached
+@st.cache_data(ttl=IMAGE_CACHE_TTL, show_spinner=False)
+def _search_image(query: str):
+    response = _SESSION.get(
+        UNSPLASH_API_URL,
+        params={"query": query, "per_page": 1, "orientation": "landscape"},
+        timeout=5
+    )
+    response.raise_for_status()
+    
+    data = response.json()
+    if data.get("results"):
+        return data["results"][0]["urls"]["raw"]
+    return None
+
 
 # Main function to get city image URL
 def get_city_image_url(city: str, country: str = "", size: str = "800x500") -> str:
@@ -36,29 +67,24 @@ def get_city_image_url(city: str, country: str = "", size: str = "800x500") -> s
     except ValueError:
         width, height = "800", "500"
     
-    # Search on Unsplash
+    # Search on Unsplash (cached per query, so thumbnail and hero of the same city share one request)
     query = f"{city} {country} travel landmark".strip()
     
+    # Skip queries whose lookup just failed
+    if _failed_queries.recently_failed(query):
+        return FALLBACK_IMAGE
+    
     # Make the API request
     try:
-        response = requests.get(
-            UNSPLASH_API_URL,
-            params={"query": query, "per_page": 1, "orientation": "landscape"},
-            headers={"Authorization": f"Client-ID {UNSPLASH_ACCESS_KEY}"},
-            timeout=5
-        )
-        
-        # Check for successful response
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("results"):
-                raw_url = data["results"][0]["urls"]["raw"]
-                return f"{raw_url}&w={width}&h={height}&fit=crop&q=80"
-        
-        return FALLBACK_IMAGE
-        
+        raw_url = _search_image(query)
     except Exception:
+        _failed_queries.record_failure(query)
         return FALLBACK_IMAGE
+    _failed_queries.clear(query)
+    
+    if raw_url:
+        return f"{raw_url}&w={width}&h={height}&fit=crop&q=80"
+    return FALLBACK_IMAGE
 
 
 # Function to get small image of city
@@ -67,4 +93,15 @@ def get_thumbnail_url(city: str, country: str = "") -> str:
 
 # Function to get large image of city
 def get_hero_image_url(city: str, country: str = "") -> str:
-    return get_city_image_url(city, country, "1600x900")
\ No newline at end of file
+    return get_city_image_url(city, country, "1600x900")
+
+
+# Look up images for several destinations at once, so cards rendered afterwards are cache hits instead of one request after another
+def prefetch_destination_images(destinations: List[Dict]) -> None:
+    if not UNSPLASH_ACCESS_KEY or not destinations:
+        return
+    
+    cities = [d.get('city', '') for d in destinations]
+    countries = [d.get('country', '') for d in destinations]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(get_city_image_url, cities, countries))
\ No newline at end of file
@@ -9,9 +9,8 @@ Structure as following:
     5. Use KNN to find similar destinations when requested
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
 import numpy as np
-from sklearn.neighbors import NearestNeighbors
 from sklearn.preprocessing import MinMaxScaler
 from src.data import get_destinations_by_budget, get_all_destinations
 
@@ -21,6 +20,12 @@ MATCHING_FEATURES = [
     "nature", "food", "nightlife", "adventure", "romance", "family",
 ]
 
+# All features used for scoring (travel styles can also weight the daily budget)
+ALL_FEATURES = MATCHING_FEATURES + ["avg_budget_per_day"]
+
+# Normalization range for a feature without any values
+DEFAULT_FEATURE_RANGE = (1.0, 5.0)
+
 # Default weights when no travel style selected
 DEFAULT_WEIGHTS = {
     "safety": 2.0, "english_level": 1.0, "crowds": 1.0, "beach": 1.0,
@@ -108,26 +113,33 @@ def get_travel_style_weights(style: str) -> Dict[str, float]:
     return DEFAULT_WEIGHTS
 
 
-# Match score calculation and ranking
-def normalize_value(value: float, min_val: float, max_val: float) -> float:
-    if max_val == min_val:
-        return 0.5
-    return (value - min_val) / (max_val - min_val)
+# Weights as array aligned with ALL_FEATURES (0 for features a style does not weight)
+def _weight_array(weights: Dict[str, float]) -> np.ndarray:
+    return np.array([weights.get(f, 0) for f in ALL_FEATURES], dtype=np.float64)
+
+
+# Weight arrays per travel style, built once at import so ranking does not rebuild them on every call
+_STYLE_WEIGHT_ARRAYS = {style: _weight_array(cfg["weights"]) for style, cfg in TRAVEL_STYLES.items()}
+_DEFAULT_WEIGHT_ARRAY = _weight_array(DEFAULT_WEIGHTS)
+
+# Indices of the features each travel style actually weights, so scoring can skip the rest
+_STYLE_WEIGHTED_COLUMNS = {style: np.flatnonzero(weight) for style, weight in _STYLE_WEIGHT_ARRAYS.items()}
+_DEFAULT_WEIGHTED_COLUMNS = np.flatnonzero(_DEFAULT_WEIGHT_ARRAY)
+
+# Shared by all sessions, so the precomputed arrays are made read-only
+for _array in [*_STYLE_WEIGHT_ARRAYS.values(), *_STYLE_WEIGHTED_COLUMNS.values(), _DEFAULT_WEIGHT_ARRAY, _DEFAULT_WEIGHTED_COLUMNS]:
+    _array.flags.writeable = False
 
 
-# Calculate feature ranges for normalization across all destinations
+# Travel style weights as array for vectorized scoring
+def get_travel_style_weight_array(style: str) -> np.ndarray:
+    return _STYLE_WEIGHT_ARRAYS.get(style, _DEFAULT_WEIGHT_ARRAY)
+
+
+# Calculate feature ranges for normalization across all destinations (same ranges the ranking uses)
 def calculate_feature_ranges(destinations: List[Dict]) -> Dict[str, tuple]:
-    ranges = {}
-    all_features = MATCHING_FEATURES + ["avg_budget_per_day"]
-    
-    for feature in all_features:
-        values = [d.get(feature) for d in destinations if d.get(feature) is not None]
-        if values:
-            ranges[feature] = (min(values), max(values))
-        else:
-            ranges[feature] = (1, 5)
-    
-    return ranges
+    mins, maxs = _feature_range_arrays(_build_score_matrix(destinations))
+    return {feature: (low, high) for feature, low, high in zip(ALL_FEATURES, mins.tolist(), maxs.tolist())}
 
 
 # Learn user preferences from chosen destinations
@@ -135,112 +147,123 @@ def preference_vector(chosen: List[Dict]) -> Dict[str, float]:
     if not chosen:
         return {}
     
-    preference = {}
-    all_features = MATCHING_FEATURES + ["avg_budget_per_day"]
-    
-    # Calculate average for each feature
-    for feature in all_features:
-        values = [d.get(feature) for d in chosen if d.get(feature) is not None]
-        if values:
-            preference[feature] = sum(values) / len(values)
+    # Calculate average for each feature in one pass over the matrix (missing values are skipped)
+    matrix = _build_score_matrix(chosen)
+    counts = (~np.isnan(matrix)).sum(axis=0)
+    sums = np.nansum(matrix, axis=0)
     
-    return preference
+    return {feature: float(total / count) for feature, total, count in zip(ALL_FEATURES, sums, counts) if count}
 
 
 # Calculate match score between destination and user preferences (0-100 scale)
 def calculate_match_score(destination: Dict, preference: Dict, feature_ranges: Dict, weights: Optional[Dict] = None) -> float:
-    if not preference:
-        return 50.0
-    
     # Use default weights if none provided
-    if weights is None:
-        weights = DEFAULT_WEIGHTS
+    weight = _DEFAULT_WEIGHT_ARRAY if weights is None else _weight_array(weights)
     
-    total_sim = 0.0
-    total_weight = 0.0
-    all_features = MATCHING_FEATURES + ["avg_budget_per_day"]
+    # Score as one-row matrix with the given feature ranges, default range if a feature has none
+    ranges = np.array([feature_ranges.get(f, DEFAULT_FEATURE_RANGE) for f in ALL_FEATURES], dtype=np.float64)
+    scores = _calculate_match_scores(_build_score_matrix([destination]), preference, weight, np.flatnonzero(weight), ranges[:, 0], ranges[:, 1])
+    return float(scores[0])
+
+
+# Build matrix of feature values for scoring (one row per destination, NaN if a value is missing)
+def _build_score_matrix(destinations: List[Dict]) -> np.ndarray:
+    rows = [[np.nan if d.get(f) is None else d[f] for f in ALL_FEATURES] for d in destinations]
+    return np.array(rows, dtype=np.float64).reshape(len(destinations), len(ALL_FEATURES))
+
+
+# Feature ranges of a score matrix as min and max arrays, default range if a feature has no values at all
+def _feature_range_arrays(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    missing = np.isnan(matrix)
+    mins = np.where(missing, np.inf, matrix).min(axis=0, initial=np.inf)
+    maxs = np.where(missing, -np.inf, matrix).max(axis=0, initial=-np.inf)
+    no_values = np.isinf(mins)
+    mins[no_values], maxs[no_values] = DEFAULT_FEATURE_RANGE
+    return mins, maxs
+
+
+# Calculate match scores for all destinations at once (0-100 scale, 50 if nothing can be compared)
+def _calculate_match_scores(matrix: np.ndarray, preference: Dict, weight: np.ndarray, columns: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    num_dests = matrix.shape[0]
+    if not preference or num_dests == 0:
+        return np.full(num_dests, 50.0)
     
-    # Calculate weighted similarity for each feature
-    for feature in all_features:
-        if feature not in preference:
-            continue
-        
-        dest_val = destination.get(feature)
-        if dest_val is None:
-            continue
-        
-        weight = weights.get(feature, 0)
-        if weight == 0:
-            continue
-        
-        # Get feature range for normalization
-        min_val, max_val = feature_ranges.get(feature, (1, 5))
-        
-        # Normalize to 0-1
-        norm_dest = normalize_value(dest_val, min_val, max_val)
-        norm_pref = normalize_value(preference[feature], min_val, max_val)
-        
-        # Similarity: 1 = same, 0 = opposite
-        similarity = 1.0 - abs(norm_dest - norm_pref)
-        
-        # Negative weight means prefer lower values
-        if weight < 0:
-            similarity = 1.0 - similarity
-        
-        # Accumulate weighted similarity
-        total_sim += similarity * abs(weight)
-        total_weight += abs(weight)
+    # Only weighted features (columns) can contribute, the others are dropped up front
+    matrix, weight, mins, maxs = matrix[:, columns], weight[columns], mins[columns], maxs[columns]
+    missing = np.isnan(matrix)
+    
+    # Normalize destinations and preference to 0-1 (0.5 if all values are equal)
+    span = maxs - mins
+    flat = span == 0
+    span[flat] = 1.0
+    pref = np.array([preference.get(ALL_FEATURES[i], np.nan) for i in columns], dtype=np.float64)
+    norm_dest = np.where(flat, 0.5, (matrix - mins) / span)
+    norm_pref = np.where(flat, 0.5, (pref - mins) / span)
     
-    if total_weight == 0:
-        return 50.0
+    # Similarity: 1 = same, 0 = opposite, negative weight means prefer lower values (flipped without branching)
+    flip = (weight < 0).astype(np.float64)
+    similarity = 1.0 - np.abs(norm_dest - norm_pref)
+    similarity = similarity * (1.0 - 2.0 * flip) + flip
     
-    return round((total_sim / total_weight) * 100, 1)
+    # Only features with a destination value and a preference count
+    active = ~missing & ~np.isnan(pref)
+    abs_weight = np.where(active, np.abs(weight), 0.0)
+    total_sim = (np.where(active, similarity, 0.0) * abs_weight).sum(axis=1)
+    total_weight = abs_weight.sum(axis=1)
+    
+    scores = np.full(num_dests, 50.0)
+    has_weight = total_weight > 0
+    scores[has_weight] = total_sim[has_weight] / total_weight[has_weight] * 100
+    return scores
 
 
 # Combine match score with weather score
 def calculate_combined_score(destination: Dict, match_score: float, weather_weight: float = 0.2) -> float:
     weather = destination.get('weather_score', 50.0) or 50.0
-    combined = (match_score * (1 - weather_weight)) + (weather * weather_weight)
-    return round(combined, 1)
+    return (match_score * (1 - weather_weight)) + (weather * weather_weight)
 
 
 # Rank destinations based on match score and weather score
 def ranking_destinations(budget_matches: List[Dict], chosen: List[Dict], travel_style: str = "balanced", use_weather: bool = True, weather_weight: float = 0.2) -> List[Dict]:
     preference = preference_vector(chosen)
-    feature_ranges = calculate_feature_ranges(budget_matches)
-    weights = get_travel_style_weights(travel_style)
+    weight = get_travel_style_weight_array(travel_style)
+    columns = _STYLE_WEIGHTED_COLUMNS.get(travel_style, _DEFAULT_WEIGHTED_COLUMNS)
     
-    scored = []
+    # Calculate match scores for all destinations at once, normalized over the ranges of these destinations
+    matrix = _build_score_matrix(budget_matches)
+    match_scores = _calculate_match_scores(matrix, preference, weight, columns, *_feature_range_arrays(matrix))
     
-    # Calculate scores for each destination
-    for dest in budget_matches:
-        d = dest.copy()
-        
-        match = calculate_match_score(d, preference, feature_ranges, weights)
-        d['match_score'] = match
-        
-        weather = d.get('weather_score', 50.0) or 50.0
-        d['weather_score'] = round(weather, 1)
-        
-        if use_weather:
-            d['combined_score'] = calculate_combined_score(d, match, weather_weight)
-        else:
-            d['combined_score'] = match
-        
-        scored.append(d)
+    # Combine match score with weather score for all destinations at once (50 if weather is missing)
+    weather_scores = np.array([d.get('weather_score', 50.0) or 50.0 for d in budget_matches], dtype=np.float64)
+    if use_weather:
+        combined_scores = (match_scores * (1 - weather_weight)) + (weather_scores * weather_weight)
+    else:
+        combined_scores = match_scores
     
-    scored.sort(key=lambda x: x['combined_score'], reverse=True)
-    return scored
+    # Best first (stable sort, so destinations with equal scores keep their order)
+    order = np.argsort(-combined_scores, kind="stable")
+    
+    # Add scores to each destination (new dict built in one go, input destinations stay untouched, scores are only rounded for display)
+    return [
+        {**budget_matches[i], 'match_score': match, 'weather_score': weather, 'combined_score': combined}
+        for i, match, weather, combined in zip(order.tolist(), match_scores[order].tolist(), weather_scores[order].tolist(), combined_scores[order].tolist())]
 
 
 # KNN (K-Nearest Neighbors) for similar destinations
 KNN_FEATURES = [
     "beach", "culture", "nature", "food", "nightlife", "adventure", "safety", "romance", "family", "crowds", "english_level"]
 
-# Cache for KNN model (avoid refitting every call)
-_knn_model = None
-_knn_scaler = None
-_knn_destinations = []
+# Fitted KNN model for one list of destinations (identified by their ids in order)
+class _KnnModel(NamedTuple):
+    key: tuple
+    scaler: MinMaxScaler
+    unit: np.ndarray
+    rows: Dict[Any, int]
+
+
+# Cache for KNN (avoid refitting every call), replaced as a whole so sessions in other threads never see a half-updated model
+# Only the model is kept, results are built from the destinations passed in, so scores and weather are never from another call
+_knn_cache: Optional[_KnnModel] = None
 
 
 # Build numpy feature matrix for KNN
@@ -252,68 +275,70 @@ def _build_feature_matrix(destinations: List[Dict]) -> np.ndarray:
     return np.array(matrix)
 
 
+# Scale rows to unit length so a dot product gives the cosine similarity (all-zero rows stay zero)
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 # Fit KNN model
-def _fit_knn(destinations: List[Dict]):
-    global _knn_model, _knn_scaler, _knn_destinations
-    
-    if not destinations:
-        return
-    
+def _fit_knn(destinations: List[Dict], key: tuple) -> _KnnModel:
     # Build feature matrix
-    _knn_destinations = destinations
     features = _build_feature_matrix(destinations)
     
     # Normalize so all features contribute equally
-    _knn_scaler = MinMaxScaler()
-    normalized = _knn_scaler.fit_transform(features)
+    scaler = MinMaxScaler()
+    normalized = scaler.fit_transform(features)
     
-    # Use cosine similarity
-    _knn_model = NearestNeighbors(
-        n_neighbors=min(10, len(destinations)),
-        metric='cosine',
-        algorithm='brute'
-    )
-    _knn_model.fit(normalized)
+    # Use cosine similarity (kept as unit rows so known targets skip the transform)
+    rows = {dest_id: i for i, dest_id in enumerate(key)}
+    return _KnnModel(key, scaler, _unit_rows(normalized), rows)
 
 
-# Find similar destinations using KNN algorithm. Uses scikit-learn NearestNeighbors with cosine similarity.
+# Find similar destinations using KNN algorithm. Uses cosine similarity as one matrix product over all destinations.
 def find_similar_destinations(target: Dict, all_destinations: List[Dict], num_similar: int = 3) -> List[Dict]:
-    global _knn_model, _knn_scaler, _knn_destinations
+    global _knn_cache
     
     # Validate inputs
     if not all_destinations or not target:
         return []
     
-    # Rebuild model if needed
-    if len(_knn_destinations) != len(all_destinations) or _knn_model is None:
-        _fit_knn(all_destinations)
-    
-    # Ensure model is ready
-    if _knn_model is None or _knn_scaler is None:
-        return []
+    # Rebuild model if the destinations changed (read the cache once, then only use this snapshot)
+    key = tuple(d.get('id') for d in all_destinations)
+    model = _knn_cache
+    if model is None or model.key != key:
+        model = _fit_knn(all_destinations, key)
+        _knn_cache = model
     
-    # Get target features
-    target_features = [float(target.get(f, 3.0) or 3.0) for f in KNN_FEATURES]
-    target_normalized = _knn_scaler.transform([target_features])
+    # Get target features, reusing the unit row if the target is one of the destinations (only possible with an id)
+    target_id = target.get('id')
+    row = model.rows.get(target_id) if target_id is not None else None
+    if row is not None:
+        target_unit = model.unit[row]
+    else:
+        target_features = [float(target.get(f, 3.0) or 3.0) for f in KNN_FEATURES]
+        target_unit = _unit_rows(model.scaler.transform([target_features]))[0]
     
-    # Find neighbors
-    k = min(num_similar + 1, len(_knn_destinations))
-    distances, indices = _knn_model.kneighbors(target_normalized, n_neighbors=k)
+    # Find neighbors: cosine similarity to all destinations, only the k best are sorted
+    cosine = model.unit @ target_unit
+    k = min(num_similar + 1, len(cosine))
+    top = np.argpartition(-cosine, k - 1)[:k]
+    top = top[np.argsort(-cosine[top], kind="stable")]
     
     # Compile results
     results = []
-    target_id = target.get('id')
     
-    # Process neighbors
-    for idx, dist in zip(indices[0], distances[0]):
-        dest = _knn_destinations[idx]
+    # Process neighbors (same row order as the model, the key guarantees it)
+    for idx in top:
+        dest = all_destinations[idx]
         
         # Skip target itself
         if dest.get('id') == target_id:
             continue
         
-        # Convert distance to similarity percentage
-        similarity = (1 - dist / 2) * 100
+        # Convert cosine similarity (-1 to 1) to similarity percentage
+        similarity = float((1 + cosine[idx]) * 50)
         
         results.append({**dest, 'similarity_score': round(similarity, 1)})
         
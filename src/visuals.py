@@ -34,6 +34,9 @@ FEATURE_CONFIG = {
     "romance": {"name": "Romance", "emoji": "💕"},
     "family": {"name": "Family", "emoji": "👨‍👩‍👧‍👦"}}
 
+# Chart labels per feature, built once at import instead of on every chart
+FEATURE_LABELS = {feature: f"{cfg['emoji']} {cfg['name']}" for feature, cfg in FEATURE_CONFIG.items()}
+
 
 # Radar Chart for User Preferences
 def create_preference_radar_chart(preferences: Dict[str, float], title: str = "Your Preferences") -> go.Figure:
@@ -45,15 +48,9 @@ def create_preference_radar_chart(preferences: Dict[str, float], title: str = "Y
     if not filtered:
         return None
     
-    categories = []
-    values = []
-    
     # Prepare data for radar chart
-    for feature, value in filtered.items():
-        cfg = FEATURE_CONFIG.get(feature, {})
-        label = f"{cfg.get('emoji', '')} {cfg.get('name', feature)}"
-        categories.append(label)
-        values.append(value)
+    categories = [FEATURE_LABELS[feature] for feature in filtered]
+    values = list(filtered.values())
     
     # Close the radar loop
     categories.append(categories[0])
@@ -91,9 +88,9 @@ def create_top_destinations_chart(destinations: List[Dict], num_destinations: in
     # Get top destinations
     top = destinations[:num_destinations]
     names = [f"{d.get('city', '? ')}, {d.get('country', '')}" for d in top]
-    scores = [d.get('combined_score', 0) for d in top]
+    scores = [round(d.get('combined_score', 0), 1) for d in top]
     
-    # Color by score
+    # Color by the same rounded score the labels show
     colors = []
     for s in scores:
         if s >= 80:
@@ -181,10 +178,10 @@ def create_weather_score_chart(destinations: List[Dict], num_destinations: int =
     # Get top destinations
     top = destinations[:num_destinations]
     names = [d.get('city', '? ') for d in top]
-    scores = [d.get('weather_score', 50) or 50 for d in top]
+    scores = [round(d.get('weather_score', 50) or 50) for d in top]
     temps = [d.get('forecast_temp') or d.get('current_temp') for d in top]
     
-    # Color by score
+    # Color by the same rounded score the labels show
     colors = []
     for s in scores:
         if s >= 80:
@@ -234,7 +231,7 @@ def create_destinations_map(destinations: List[Dict], highlight_best: bool = Tru
         
         city = dest.get('city', '?')
         country = dest.get('country', '')
-        score = dest.get('combined_score', 50)
+        score = round(dest.get('combined_score', 50), 1)
         
         # Collect data
         lats.append(lat)
@@ -10,61 +10,101 @@ Structure as following (functions):
 """
 # import necessary libraries and API
 from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import streamlit as st
+from src.http_utils import FailureCache, make_session
 
 API_URL = "https://api.open-meteo.com/v1/forecast"
 TIMEOUT = 10  # Increased timeout
+MAX_WORKERS = 8  # Parallel API requests (requests are I/O-bound)
+
+# Shared session with pooled connections for all weather requests
+_SESSION = make_session(MAX_WORKERS)
+
+# How long API responses are reused across reruns and sessions (in seconds)
+WEATHER_CACHE_TTL = 30 * 60  # Current weather changes during the day
+FORECAST_CACHE_TTL = 3 * 60 * 60  # Forecasts are only updated a few times a day
+FAILED_CACHE_TTL = 5 * 60  # Failed requests are not retried for a few minutes
+
+# Failed requests per location, so an unreachable API is not hit again on every search
+_failed_requests = FailureCache(FAILED_CACHE_TTL)
+
+
+# Fetch raw current weather response, failed requests raise and are therefore never cached
+@st.cache_data(ttl=WEATHER_CACHE_TTL, show_spinner=False)
+def _fetch_current_weather(lat: float, lon: float) -> Dict[str, Any]:
+    resp = _SESSION.get(API_URL, params={"latitude": lat, "longitude": lon, "current_weather": True}, timeout=TIMEOUT)
+    resp.raise_for_status()
+    return resp.json()
+
+
+# Fetch raw daily forecast response, failed requests raise and are therefore never cached
+@st.cache_data(ttl=FORECAST_CACHE_TTL, show_spinner=False)
+def _fetch_daily_forecast(lat: float, lon: float, start: str, end: str) -> Dict[str, Any]:
+    resp = _SESSION.get(API_URL, params={"latitude": lat, "longitude": lon, "daily": ["temperature_2m_max", "temperature_2m_min", "precipitation_sum"], "timezone": "auto", "start_date": start, "end_date": end}, timeout=TIMEOUT)
+    resp.raise_for_status()
+    return resp.json()
 
 
 # Get current weather data for a location
 def get_weather(lat: float, lon: float) -> Dict[str, Any]:
+    lat, lon = round(lat, 4), round(lon, 4)
+    key = ("weather", lat, lon)
+    
+    # Skip locations whose request just failed
+    if _failed_requests.recently_failed(key):
+        return {"success": False}
+    
     try:
-        # Make API request
-        resp = requests.get(API_URL, params={"latitude": lat, "longitude": lon, "current_weather": True}, timeout=TIMEOUT)
+        # Make API request (coordinates rounded so the same location always hits the same cache entry)
+        data = _fetch_current_weather(lat, lon)
+        current = data.get("current_weather", {})
+        temp = current.get("temperature")
         
-        # Check for successful response
-        if resp.status_code == 200:
-            data = resp.json()
-            current = data.get("current_weather", {})
-            temp = current.get("temperature")
-            
-            # Return relevant weather data if available
-            if temp is not None:
-                return {"temperature": temp, "windspeed": current.get("windspeed"), "success": True}
+        # Return relevant weather data if available
+        if temp is not None:
+            _failed_requests.clear(key)
+            return {"temperature": temp, "windspeed": current.get("windspeed"), "success": True}
     
     # If any error occurs, log it and return failure
     except requests.RequestException as e:
         print(f"Weather API error: {e}")
+        _failed_requests.record_failure(key)
     
     return {"success": False}
 
 
 # Fetch weather forecast for the specified date range and location
 def get_forecast(lat: float, lon: float, start: str, end: str) -> Dict[str, Any]:
+    lat, lon = round(lat, 4), round(lon, 4)
+    key = ("forecast", lat, lon, start, end)
+    
+    # Skip locations whose request just failed
+    if _failed_requests.recently_failed(key):
+        return {"success": False}
+    
     try:
-        # Make API request for daily forecast data
-        resp = requests.get(API_URL, params={"latitude": lat, "longitude": lon, "daily": ["temperature_2m_max", "temperature_2m_min", "precipitation_sum"], "timezone": "auto", "start_date": start, "end_date": end}, timeout=TIMEOUT)
+        # Make API request for daily forecast data (coordinates rounded so the same location always hits the same cache entry)
+        data = _fetch_daily_forecast(lat, lon, start, end)
+        daily = data.get("daily", {})
+        temps_max = daily.get("temperature_2m_max", [])
+        temps_min = daily.get("temperature_2m_min", [])
+        precip = daily.get("precipitation_sum", [])
         
-        # Check for successful response
-        if resp.status_code == 200:
-            data = resp.json()
-            daily = data.get("daily", {})
-            temps_max = daily.get("temperature_2m_max", [])
-            temps_min = daily.get("temperature_2m_min", [])
-            precip = daily.get("precipitation_sum", [])
+        # Calculate average temperatures and rain days
+        if temps_max and temps_min:
+            avg = (sum(temps_max)/len(temps_max) + sum(temps_min)/len(temps_min)) / 2
+            rain_days = sum(1 for p in precip if p and p > 1)
             
-            # Calculate average temperatures and rain days
-            if temps_max and temps_min:
-                avg = (sum(temps_max)/len(temps_max) + sum(temps_min)/len(temps_min)) / 2
-                rain_days = sum(1 for p in precip if p and p > 1)
-                
-                # Return calculated forecast data
-                return {"avg_temp": round(avg, 1), "max_temp": round(max(temps_max), 1), "min_temp": round(min(temps_min), 1), "rain_days": rain_days, "total_days": len(temps_max), "success": True}
+            # Return calculated forecast data
+            _failed_requests.clear(key)
+            return {"avg_temp": round(avg, 1), "max_temp": round(max(temps_max), 1), "min_temp": round(min(temps_min), 1), "rain_days": rain_days, "total_days": len(temps_max), "success": True}
             
     # If any error occurs, log it and return failure       
     except requests.RequestException as e:
         print(f"Forecast API error: {e}")
+        _failed_requests.record_failure(key)
     return {"success": False}
 
 
@@ -101,49 +141,58 @@ def enrich_destinations_with_weather(destinations: List[Dict], preferred: Tuple[
         progress = st.progress(0, text="Loading weather...")
     
     enriched = []
+    pending = {}
     success_count = 0
     
-    # Iterate through destinations to fetch and calculate weather data
-    for i, dest in enumerate(destinations):
-        d = dest.copy()
-        dest_id = dest.get("id")
-        
-        # Check cache first
-        if dest_id in cache:
-            d['weather_score'] = cache[dest_id]['score']
-            d['current_temp'] = cache[dest_id].get('temp')
-            if d['current_temp'] is not None:
-                success_count += 1
-
-        # If not cached, fetch from API
-        else:
-            lat = dest.get('latitude')
-            lon = dest.get('longitude')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Iterate through destinations to use cached data or start API requests
+        for dest in destinations:
+            d = dest.copy()
+            dest_id = dest.get("id")
             
-            # Only fetch if coordinates are available
-            if lat is not None and lon is not None:
-                weather = get_weather(lat, lon)
-                
-                # If successful, calculate score and cache it
-                if weather.get("success"):
-                    temp = weather.get('temperature')
-                    score = calc_weather_score(temp, preferred)
-                    d['weather_score'] = score
-                    d['current_temp'] = temp
-                    cache[dest_id] = {'score': score, 'temp': temp}
+            # Check cache first
+            if dest_id in cache:
+                d['weather_score'] = cache[dest_id]['score']
+                d['current_temp'] = cache[dest_id].get('temp')
+                if d['current_temp'] is not None:
                     success_count += 1
+
+            # If not cached, fetch from API in the background
+            else:
+                lat = dest.get('latitude')
+                lon = dest.get('longitude')
+                
+                # Only fetch if coordinates are available
+                if lat is not None and lon is not None:
+                    pending[executor.submit(get_weather, lat, lon)] = d
                 else:
                     d['weather_score'] = 50.0
                     d['current_temp'] = None
+            
+            enriched.append(d)
+        
+        # Process API results as they arrive (session state is only touched here, not in worker threads)
+        done = len(enriched) - len(pending)
+        for future in as_completed(pending):
+            d = pending[future]
+            weather = future.result()
+            
+            # If successful, calculate score and cache it
+            if weather.get("success"):
+                temp = weather.get('temperature')
+                score = calc_weather_score(temp, preferred)
+                d['weather_score'] = score
+                d['current_temp'] = temp
+                cache[d.get("id")] = {'score': score, 'temp': temp}
+                success_count += 1
             else:
                 d['weather_score'] = 50.0
                 d['current_temp'] = None
-        
-        enriched.append(d)
-        
-        # Update progress bar if enabled
-        if show_progress:
-            progress.progress((i + 1) / len(destinations), text=f"Weather: {i+1}/{len(destinations)}")
+            
+            # Update progress bar if enabled
+            done += 1
+            if show_progress:
+                progress.progress(done / len(destinations), text=f"Weather: {done}/{len(destinations)}")
     
     # Clear progress bar and show summary if enabled
     if show_progress:
@@ -166,66 +215,75 @@ def enrich_destinations_with_forecast(destinations: List[Dict], preferred: Tuple
         progress = st.progress(0, text="Loading forecasts...")
     
     enriched = []
+    pending = {}
     success_count = 0
     
-    # Iterate through destinations to fetch and calculate forecast data
-    for i, dest in enumerate(destinations):
-        d = dest.copy()
-        dest_id = dest.get("id")
-        
-        # Check cache first
-        if dest_id in cache:
-            cached = cache[dest_id]
-            d['weather_score'] = cached['score']
-            d['forecast_temp'] = cached.get('avg_temp')
-            d['rain_days'] = cached.get('rain_days', 0)
-            if d['forecast_temp'] is not None:
-                success_count += 1
-        
-        # If not cached, fetch from API
-        else:
-            lat = dest.get('latitude')
-            lon = dest.get('longitude')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Iterate through destinations to use cached data or start API requests
+        for dest in destinations:
+            d = dest.copy()
+            dest_id = dest.get("id")
             
-            # Only fetch if coordinates are available
-            if lat is not None and lon is not None:
-                forecast = get_forecast(lat, lon, start, end)
-                
-                # If successful, calculate score and cache it
-                if forecast.get("success"):
-                    avg_temp = forecast.get('avg_temp', 20)
-                    temp_score = calc_weather_score(avg_temp, preferred)
-                    
-                    # Reduce score for rainy days
-                    total_days = forecast.get('total_days', 1)
-                    rain_days = forecast.get('rain_days', 0)
-                    rain_penalty = (rain_days / total_days) * 20 if total_days > 0 else 0
-                    final_score = max(0, temp_score - rain_penalty)
-                    
-                    d['weather_score'] = round(final_score, 1)
-                    d['forecast_temp'] = avg_temp
-                    d['rain_days'] = rain_days
-                    
-                    cache[dest_id] = {
-                        'score': d['weather_score'],
-                        'avg_temp': avg_temp,
-                        'rain_days': rain_days
-                    }
+            # Check cache first
+            if dest_id in cache:
+                cached = cache[dest_id]
+                d['weather_score'] = cached['score']
+                d['forecast_temp'] = cached.get('avg_temp')
+                d['rain_days'] = cached.get('rain_days', 0)
+                if d['forecast_temp'] is not None:
                     success_count += 1
+            
+            # If not cached, fetch from API in the background
+            else:
+                lat = dest.get('latitude')
+                lon = dest.get('longitude')
+                
+                # Only fetch if coordinates are available
+                if lat is not None and lon is not None:
+                    pending[executor.submit(get_forecast, lat, lon, start, end)] = d
                 else:
                     d['weather_score'] = 50.0
                     d['forecast_temp'] = None
                     d['rain_days'] = 0
+            
+            enriched.append(d)
+        
+        # Process API results as they arrive (session state is only touched here, not in worker threads)
+        done = len(enriched) - len(pending)
+        for future in as_completed(pending):
+            d = pending[future]
+            forecast = future.result()
+            
+            # If successful, calculate score and cache it
+            if forecast.get("success"):
+                avg_temp = forecast.get('avg_temp', 20)
+                temp_score = calc_weather_score(avg_temp, preferred)
+                
+                # Reduce score for rainy days
+                total_days = forecast.get('total_days', 1)
+                rain_days = forecast.get('rain_days', 0)
+                rain_penalty = (rain_days / total_days) * 20 if total_days > 0 else 0
+                final_score = max(0, temp_score - rain_penalty)
+                
+                d['weather_score'] = round(final_score, 1)
+                d['forecast_temp'] = avg_temp
+                d['rain_days'] = rain_days
+                
+                cache[d.get("id")] = {
+                    'score': d['weather_score'],
+                    'avg_temp': avg_temp,
+                    'rain_days': rain_days
+                }
+                success_count += 1
             else:
                 d['weather_score'] = 50.0
                 d['forecast_temp'] = None
                 d['rain_days'] = 0
-        
-        enriched.append(d)
-        
-        # Update progress bar if enabled
-        if show_progress:
-            progress.progress((i + 1) / len(destinations), text=f"Forecast: {i+1}/{len(destinations)}")
+            
+            # Update progress bar if enabled
+            done += 1
+            if show_progress:
+                progress.progress(done / len(destinations), text=f"Forecast: {done}/{len(destinations)}")
     
     # Clear progress bar and show summary if enabled
     if show_progress:
@@ -35,7 +35,7 @@ from src.visuals import (
     create_weather_score_chart,
     create_destinations_map,)
 
-from src.images import get_thumbnail_url, get_hero_image_url
+from src.images import get_thumbnail_url, get_hero_image_url, prefetch_destination_images
 
 # Define constants and default app configuration
 ROUNDS = 7
@@ -50,6 +50,10 @@ LOCATIONS_PER_ROUND = 3
 WEATHER_WEIGHT = 0.2
 MAX_DESTINATIONS = 50
 
+# Emojis for the top preferences shown on the results page
+PREFERENCE_EMOJIS = {
+    "beach": "🏖️", "culture": "🏛️", "nature": "🌿", "food": "🍽️", "nightlife": "🎉", "adventure": "🏔️", "romance": "💕", "family": "👨‍👩‍👧‍👦", "safety": "🛡️", "english_level": "🗣️", "crowds": "👥"}
+
 # Streamlit page configuration
 st.set_page_config(
     page_title="Travel Matching",
@@ -102,10 +106,9 @@ def get_smart_round_locations() -> List[Dict[str, Any]]:
     if round_key in st.session_state and st.session_state[round_key]:
         return st.session_state[round_key]
     
-    # Get destinations not shown yet
-    available = [
-        d for d in st.session_state.budget_matches
-        if d["id"] not in st.session_state.id_used]
+    # Get destinations not shown yet (set for constant-time lookups)
+    used = set(st.session_state.id_used)
+    available = [d for d in st.session_state.budget_matches if d["id"] not in used]
     
     if not available:
         return []
@@ -127,7 +130,8 @@ def get_smart_round_locations() -> List[Dict[str, Any]]:
             # Mix: 2 from top matches, 1 random for variety
             top_pool = ranked[:10]
             selected_top = random.sample(top_pool, min(2, len(top_pool)))
-            remaining = [d for d in ranked if d not in selected_top]
+            top_ids = {d["id"] for d in selected_top}
+            remaining = [d for d in ranked if d["id"] not in top_ids]
             selected_other = random.sample(remaining, 1) if remaining else []
             locations = selected_top + selected_other
             random.shuffle(locations)
@@ -277,11 +281,12 @@ def render_start_page():
     # Travel dates: Start and end date inputs
     st.subheader("📅 Travel Dates")
     date_col1, date_col2 = st.columns(2)
+    today = datetime.now().date()
     
     # Departure date
     with date_col1:
-        default_start = datetime.now() + timedelta(days=7)
-        travel_date_start = st.date_input("Departure", value=default_start, min_value=datetime.now().date(), max_value=datetime.now().date() + timedelta(days=365))
+        default_start = today + timedelta(days=7)
+        travel_date_start = st.date_input("Departure", value=default_start, min_value=today, max_value=today + timedelta(days=365))
     
     # Return date
     with date_col2:
@@ -294,7 +299,7 @@ def render_start_page():
     st.info(f"💵 **CHF {total_budget}** for **{num_travelers} {travelers_text}** over **{trip_days} days**")
     
     # Check forecast availability (based on start date)
-    days_until = (travel_date_start - datetime.now().date()).days
+    days_until = (travel_date_start - today).days
     can_use_forecast = 0 <= days_until <= 16
 
     if can_use_forecast:
@@ -312,27 +317,13 @@ def render_start_page():
     style_options = list(TRAVEL_STYLES.keys())
     selected_style = st.session_state.get("travel_style", "balanced")
     
-    # Two rows of buttons
-    row1 = style_options[:5]
-    row2 = style_options[5:]
-    
-    # Columns for first row 
-    cols1 = st.columns(len(row1))
-    for i, style_key in enumerate(row1):
-        style = TRAVEL_STYLES[style_key]
-        with cols1[i]:
-            btn_type = "primary" if selected_style == style_key else "secondary"
-            if st.button(style["name"], key=f"style_{style_key}", 
-                        use_container_width=True, type=btn_type):
-                st.session_state.travel_style = style_key
-                st.rerun()
-
-    # Columns for second row
-    if row2:
-        cols2 = st.columns(len(row2))
-        for i, style_key in enumerate(row2):
+    # Two rows of buttons, one columns layout per row
+    for row in (style_options[:5], style_options[5:]):
+        if not row:
+            continue
+        for col, style_key in zip(st.columns(len(row)), row):
             style = TRAVEL_STYLES[style_key]
-            with cols2[i]:
+            with col:
                 btn_type = "primary" if selected_style == style_key else "secondary"
                 if st.button(style["name"], key=f"style_{style_key}", 
                             use_container_width=True, type=btn_type):
@@ -465,7 +456,8 @@ def render_matching_page():
     
     st.divider()
     
-    # Render each destination card
+    # Render each destination card (images of all cards are looked up in parallel first)
+    prefetch_destination_images(locations)
     for i, loc in enumerate(locations):
         render_destination_card(loc, i)
     
@@ -528,6 +520,12 @@ def render_results_page():
     
     best = ranked[0]
     
+    # Takes similar destinations from the machine learning model in matching.py
+    similar = find_similar_destinations(best, ranked, num_similar=3)
+    
+    # Look up images of the winner and similar destinations in parallel before rendering
+    prefetch_destination_images([best] + similar)
+    
     
     # The following sections render different parts of the results page. Every section is marked with a number for clarity.
     
@@ -535,14 +533,14 @@ def render_results_page():
     hero_url = get_hero_image_url(best.get('city', ''), best.get('country', ''))
     st.image(hero_url, use_container_width=True)
     
-    # 2. Winner info with temperature and score
-    score = best.get('combined_score', 0)
+    # 2. Winner info with temperature and score (rounded once, so color and label match the shown value)
+    score = round(best.get('combined_score', 0), 1)
     color = get_score_color(score)
     label = get_score_label(score)
     
     # 2.1 Display winner info
     st.success(f"### 🏆 {best['city']}, {best['country']}")
-    st.markdown(f"**{color} Score: {score}%** - {label}")
+    st.markdown(f"**{color} Score: {score:.1f}%** - {label}")
     
     # 2.2 Show temperature info
     temp_display = get_temperature_display(best)
@@ -596,9 +594,6 @@ def render_results_page():
     st.subheader("✨ You Might Also Like")
     st.caption("Destinations with similar characteristics")
     
-    # Takes similar destinations from the machine learning model in matching.py
-    similar = find_similar_destinations(best, ranked, num_similar=3)
-    
     # Render each similar destination 
     if similar:
         for dest in similar:
@@ -607,7 +602,7 @@ def render_results_page():
             country = dest.get('country', '')
             flight = dest.get('flight_price') or 0
             daily = dest.get('avg_budget_per_day') or 0
-            combined = dest.get('combined_score', 0)
+            combined = round(dest.get('combined_score', 0), 1)
             total = (flight * num_travelers) + (daily * trip_days * num_travelers)
             
             img_col, info_col = st.columns([1, 3])
@@ -628,7 +623,7 @@ def render_results_page():
                 # Show scores and costs in columns
                 c1, c2, c3 = st.columns(3)
                 with c1:
-                    st.write(f"{get_score_color(combined)} {combined}%")
+                    st.write(f"{get_score_color(combined)} {combined:.1f}%")
                     st.caption("Match")
                 with c2:
                     st.write(f"✈️ CHF {flight * num_travelers}")
@@ -669,10 +664,8 @@ def render_results_page():
         
             # Display top 3 preferences with emojis
             st.markdown("**🎯 Your Top 3 Preferences:**")
-            emoji_map = {
-                "beach": "🏖️", "culture": "🏛️", "nature": "🌿", "food": "🍽️", "nightlife": "🎉", "adventure": "🏔️", "romance": "💕", "family": "👨‍👩‍👧‍👦", "safety": "🛡️", "english": "🗣️", "crowds": "👥"}
             for i, (pref, value) in enumerate(top_3, 1):
-                emoji = emoji_map.get(pref, "•")
+                emoji = PREFERENCE_EMOJIS.get(pref, "•")
                 st.write(f"{i}.{emoji} **{pref.capitalize()}**: {value:.1f}/5")
 
     # Tab 2: Top 10 destinations bar chart